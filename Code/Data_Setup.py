@@ -9,21 +9,59 @@ class Data_Container:
 
 
 
+def To_Device(  Array       : numpy.ndarray,
+                Device      : torch.device,
+                Data_Type   : numpy.dtype = numpy.float32) -> torch.Tensor:
+    """ This function converts a numpy array to a tensor on Device. We cast the
+    array to Data_Type on the host (if it doesn't already use that type), so
+    the tensor arrives on Device with the right type. If Device is the CPU and
+    Array already uses Data_Type, the returned tensor shares its memory with
+    Array (no copy). If Device is a GPU, we stage the array in pinned
+    (page-locked) memory and copy it over asynchronously. This lets the copy
+    overlap with whatever we do next.
+
+    ----------------------------------------------------------------------------
+    Arguments:
+
+    Array : The numpy array we want to move to Device.
+
+    Device : The device we want the returned tensor to live on.
+
+    Data_Type : The numpy data type we want the returned tensor to use. This
+    should match the data type of the networks (single precision, by default).
+
+    ----------------------------------------------------------------------------
+    Returns:
+
+    A tensor on Device holding the contents of Array. """
+
+    # Cast the array to Data_Type (if necessary), then wrap it in a tensor
+    # (this does not copy it).
+    Tensor = torch.from_numpy(numpy.ascontiguousarray(Array, dtype = Data_Type));
+
+    # If we're staying on the CPU, we're done.
+    if(Device.type == 'cpu'):
+        return Tensor;
+
+    # Otherwise, pin the tensor and send it to the device.
+    if(Device.type == 'cuda'):
+        Tensor = Tensor.pin_memory();
+
+    return Tensor.to(device = Device, non_blocking = True);
+
+
+
 def Data_Loader(DataSet_Name   : str,
                 Device         : torch.device,
                 Mode           : str):
     """ This function loads a DataSet from file, converts it contents to a torch
     Tensor, and returns the result.
 
-    Note that if we're in Discovery mode, then we assume that the DataSet file
-    contains Test/Train_Inputs, and Test/Train_Targets. By contrast, if we're
-    in PINNs mode, we assume that the DataSet file contains IC_Inputs/Targets,
-    and Upper/Lower_Bound_Coords. Here, Upper_Bound_Coords and Lower_Bound_Coords
-    are lists of the form {(t_0, x_L), ... , (t_N, x_L)} and {(t_0, x_H), ... ,
-    (t_M, x_H)}, where x_L and x_H represent the upper and lower edges of the
-    spatial domain. We assume the coordinates in IC_Inputs are uniformly spaced,
-    with spacing dx, and that the periodic boundary occurs dx beyond the x
-    coordinate of the last IC_Input.
+    We assume that the DataSet file contains Test/Train_Inputs,
+    Test/Train_Targets, and Input_Bounds (see Data/Create_Data_Set.py). We move
+    each of these to Device exactly once, here. Everything downstream (training,
+    testing, and collocation point generation) reuses these device tensors, so
+    we never need to copy them again.
 
     Note: This function is currently hardcoded to work with data involving 1
     spatial dimension.
@@ -36,13 +74,22 @@ def Data_Loader(DataSet_Name   : str,
 
     Device : The device we're running training on.
 
-    Mode : Which mode we're running in (PINNs or Discovery).
+    Mode : Which mode we're running in (Discovery or Extraction).
 
     ----------------------------------------------------------------------------
     Returns:
 
-    A Data Container object. What's in that container depends on which mode
-    we're in. """
+    A Data Container object. Regardless of the mode, it holds the following
+    tensors (all on Device, in single precision):
+        Train_Inputs, Test_Inputs: Two-column tensors whose ith row holds the
+        t, x coordinates of the ith training/testing data point.
+
+        Train_Targets, Test_Targets: One-dimensional tensors whose ith entry
+        holds the (noisy) value of the solution at the ith training/testing
+        data point.
+
+        Input_Bounds: A two-column tensor whose ith row holds the lower and
+        upper bounds of the problem domain along the ith coordinate. """
 
     # Load the DataSet.
     DataSet_Path    = "../Data/DataSets/" + DataSet_Name + ".npz";
@@ -58,15 +105,69 @@ def Data_Loader(DataSet_Name   : str,
     Test_Inputs     : numpy.ndarray = DataSet["Test_Inputs"];
     Test_Targets    : numpy.ndarray = DataSet["Test_Targets"];
 
-    # Convert these to tensors and add them to the container.
-    Container.Train_Inputs  = torch.from_numpy(Train_Inputs).to(device = Device);
-    Container.Train_Targets = torch.from_numpy(Train_Targets).to(device = Device);
-
-    Container.Test_Inputs  = torch.from_numpy(Test_Inputs).to(device = Device);
-    Container.Test_Targets = torch.from_numpy(Test_Targets).to(device = Device);
-
-    # Finally, fetch the Input Bounds array.
-    Container.Input_Bounds = DataSet["Input_Bounds"];
+    # If we're running on a GPU, we issue the copies to Device on a side
+    # stream. This lets each copy overlap with the host-side work needed to
+    # prepare the next one. (torch.cuda.stream does nothing when passed None,
+    # so on the CPU the block below just runs normally).
+    Copy_Stream = None;
+    if(Device.type == 'cuda'):
+        Copy_Stream = torch.cuda.Stream(device = Device);
+
+    with torch.cuda.stream(Copy_Stream):
+        # Convert these to single precision tensors (the data type the
+        # networks use) and add them to the container. Some DataSets store the
+        # targets in double precision; To_Device casts them on the host so that
+        # we never mix data types on Device.
+        if(Device.type == 'cpu'):
+            # On the CPU, we wrap each array directly. This way, each tensor
+            # shares its memory with the corresponding DataSet array (unless
+            # To_Device needs to cast it).
+            Container.Train_Inputs  = To_Device(Train_Inputs,  Device);
+            Container.Train_Targets = To_Device(Train_Targets, Device);
+
+            Container.Test_Inputs   = To_Device(Test_Inputs,   Device);
+            Container.Test_Targets  = To_Device(Test_Targets,  Device);
+        else:
+            # Otherwise, we pack the training and testing inputs into a single
+            # tensor (and likewise for the targets), so that each one takes one
+            # allocation and one transfer to Device. The Train/Test tensors in
+            # the container are views into these.
+            Num_Train : int = Train_Inputs.shape[0];
+
+            Inputs  : torch.Tensor = To_Device(numpy.concatenate((Train_Inputs,  Test_Inputs),  axis = 0), Device);
+            Targets : torch.Tensor = To_Device(numpy.concatenate((Train_Targets, Test_Targets), axis = 0), Device);
+
+            Container.Train_Inputs  = Inputs[:Num_Train];
+            Container.Train_Targets = Targets[:Num_Train];
+
+            Container.Test_Inputs   = Inputs[Num_Train:];
+            Container.Test_Targets  = Targets[Num_Train:];
+
+        # Fetch the Input Bounds array. We use this to generate collocation
+        # points on Device every epoch, so we move it there once, now. We check
+        # that the bounds are valid first, while they're still on the host.
+        Input_Bounds_Array : numpy.ndarray = DataSet["Input_Bounds"];
+        assert(numpy.all(Input_Bounds_Array[:, 0] <= Input_Bounds_Array[:, 1]));
+
+        Container.Input_Bounds  = To_Device(Input_Bounds_Array, Device);
+
+    # If we used a side stream, make the current stream wait for the copies to
+    # finish before anything uses the data. We also tell the caching allocator
+    # that the current stream uses these tensors.
+    if(Copy_Stream is not None):
+        Current_Stream = torch.cuda.current_stream(Device);
+        Current_Stream.wait_stream(Copy_Stream);
+        for Tensor in (Container.Train_Inputs, Container.Train_Targets,
+                       Container.Test_Inputs,  Container.Test_Targets,
+                       Container.Input_Bounds):
+            Tensor.record_stream(Current_Stream);
+
+    # We use the data every epoch, so make sure it all actually lives on
+    # Device (rather than silently falling back to the CPU).
+    for Tensor in (Container.Train_Inputs, Container.Train_Targets,
+                   Container.Test_Inputs,  Container.Test_Targets,
+                   Container.Input_Bounds):
+        assert(Tensor.device.type == Device.type);
 
     # The container is now full. Return it!
     return Container;
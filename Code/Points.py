@@ -1,11 +1,9 @@
-import numpy;
 import torch;
-import random;
 
 
 
 def Generate_Points(
-        Bounds     : numpy.array,
+        Bounds     : torch.Tensor,
         Num_Points : int,
         Data_Type  : torch.dtype,
         Device     : torch.device = torch.device('cpu')) -> torch.Tensor:
@@ -17,14 +15,18 @@ def Generate_Points(
     Arguments:
 
     Bounds: A two-column tensor. Whose ith row contains the lower and upper
-    bounds of the ith sub-rectangle of the rectangle.
+    bounds of the ith sub-rectangle of the rectangle. We assume that these
+    bounds are valid (Bounds[i, 0] <= Bounds[i, 1]). We do not check this here,
+    since doing so would force a device sync on every call (Data_Loader checks
+    the bounds when it loads them).
 
     Num_Points: The number of points we want to generate.
 
     Data_Type: The data type used for the coords. Should be torch.float64
     (double precision) or torch.float32 (single precision).
     
-    Device: The device you want the Point tensor to be stored on.
+    Device: The device you want the Point tensor to be stored on. We also
+    generate the points on this device.
 
     ----------------------------------------------------------------------------
     Returns:
@@ -40,23 +42,17 @@ def Generate_Points(
     # in Bounds.
     Num_Dim : int = Bounds.shape[0];
 
-    # Check that the Bounds are valid.
-    for j in range(Num_Dim):
-        assert(Bounds[j, 0] <= Bounds[j, 1]);
-
-    # Make a tensor to hold all the points.
-    Points = torch.empty((Num_Points, Num_Dim),
-                          dtype  = Data_Type,
-                          device = Device);
-
-    # Populate the coordinates in Points, one coordinate at a time.
-    for j in range(Num_Dim):
-        # Get the upper and lower bounds for the jth coordinate.
-        Lower_Bound : float = Bounds[j, 0];
-        Upper_Bound : float = Bounds[j, 1];
-
-        # Cycle through the points.
-        for i in range(Num_Points):
-            Points[i, j] = random.uniform(Lower_Bound, Upper_Bound);
+    # Fetch the lower and upper bounds. We broadcast these across the rows of
+    # Points. Note that if Bounds already lives on Device and uses Data_Type
+    # (which it should), then this does not copy anything.
+    Lower_Bounds = Bounds[:, 0].to(dtype = Data_Type, device = Device);
+    Upper_Bounds = Bounds[:, 1].to(dtype = Data_Type, device = Device);
+
+    # Draw every coordinate from a uniform distribution on [0, 1), then map the
+    # jth column onto [Lower_Bounds[j], Upper_Bounds[j]].
+    Points = torch.rand((Num_Points, Num_Dim),
+                         dtype  = Data_Type,
+                         device = Device);
+    Points.mul_(Upper_Bounds - Lower_Bounds).add_(Lower_Bounds);
 
     return Points;
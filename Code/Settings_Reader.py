@@ -373,6 +373,7 @@ def Settings_Reader() -> Settings_Container:
     Settings.Epochs                 = int(  Read_Setting(File, "Number of Epochs [int] :"));
     Settings.Learning_Rate          = float(Read_Setting(File, "Learning Rate [float] :"));
     Settings.Epochs_Between_Prints  = int(  Read_Setting(File, "Epochs between testing [int] :"));
+    Settings.Mixed_Precision        = Read_Bool_Setting(File, "Mixed Precision [bool] :");
 
     # All done! Return the settings!
     File.close();
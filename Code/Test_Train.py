@@ -1,6 +1,5 @@
 import numpy as np;
 import torch;
-from typing import Tuple;
 
 from Network import Neural_Network;
 from Loss_Functions import Data_Loss, Collocation_Loss;
@@ -17,7 +16,8 @@ def Discovery_Training(
         Data_Values                 : torch.Tensor,
         Optimizer                   : torch.optim.Optimizer,
         Data_Type                   : torch.dtype = torch.float32,
-        Device                      : torch.device = torch.device('cpu')) -> None:
+        Device                      : torch.device = torch.device('cpu'),
+        Mixed_Precision             : bool = False) -> None:
     """ This function runs one epoch of training when in "Discovery" mode. In
     this mode, we enforce the leaned PDE at the Collocation_Points and the
     Data_Values at the Data_Points.
@@ -60,6 +60,10 @@ def Discovery_Training(
 
     Device: The device for Sol_NN and PDE_NN.
 
+    Mixed_Precision: If true, we evaluate the loss in bfloat16 (using
+    torch.autocast). The network parameters, and their gradients, stay in
+    Data_Type.
+
     ----------------------------------------------------------------------------
     Returns:
 
@@ -73,26 +77,38 @@ def Discovery_Training(
     def Discovery_Closure():
         # Zero out the gradients (if they are enabled).
         if (torch.is_grad_enabled()):
-            Optimizer.zero_grad();
+            Optimizer.zero_grad(set_to_none = True);
 
         # Evaluate the Loss (Note, we enforce a BC of 0)
-        Loss = (Collocation_Loss(
-                    Sol_NN                      = Sol_NN,
-                    PDE_NN                      = PDE_NN,
-                    Time_Derivative_Order       = Time_Derivative_Order,
-                    Spatial_Derivative_Order    = Spatial_Derivative_Order,
-                    Collocation_Coords          = Collocation_Coords,
-                    Data_Type                   = Data_Type,
-                    Device                      = Device)
-
-                +
-
-                Data_Loss(
-                    Sol_NN = Sol_NN,
-                    Data_Coords = Data_Coords,
-                    Data_Values = Data_Values,
-                    Data_Type = Data_Type,
-                    Device    = Device));
+        # Note: We evaluate Sol_NN on the collocation and data points
+        # separately (rather than passing both through Sol_NN as one batch).
+        # Why? Collocation_Loss differentiates Sol_NN with respect to its
+        # inputs several times. Each of those autograd.grad calls back-propagates
+        # through the entire batch that Sol_NN was evaluated on. If we batched
+        # the data points with the collocation points, each derivative would
+        # also cost a pass over the data points, which is more expensive than
+        # the forward pass that batching would save.
+        #
+        # If Mixed_Precision is true, we evaluate the loss in bfloat16. Note
+        # that we back-propagate outside of the autocast context.
+        with torch.autocast(device_type = Device.type, dtype = torch.bfloat16, enabled = Mixed_Precision):
+            Loss = (Collocation_Loss(
+                        Sol_NN                      = Sol_NN,
+                        PDE_NN                      = PDE_NN,
+                        Time_Derivative_Order       = Time_Derivative_Order,
+                        Spatial_Derivative_Order    = Spatial_Derivative_Order,
+                        Collocation_Coords          = Collocation_Coords,
+                        Data_Type                   = Data_Type,
+                        Device                      = Device)
+
+                    +
+
+                    Data_Loss(
+                        Sol_NN = Sol_NN,
+                        Data_Coords = Data_Coords,
+                        Data_Values = Data_Values,
+                        Data_Type = Data_Type,
+                        Device    = Device));
 
         # Back-propigate to compute gradients of Loss with respect to network
         # parameters (only do if this if the loss requires grad)
@@ -115,7 +131,7 @@ def Discovery_Testing(
         Data_Coords                 : torch.Tensor,
         Data_Values                 : torch.Tensor,
         Data_Type                   : torch.dtype = torch.float32,
-        Device                      : torch.device = torch.device('cpu')) -> Tuple[float, float]:
+        Device                      : torch.device = torch.device('cpu')) -> torch.Tensor:
     """ This function runs testing when in "Discovery" mode. You CAN NOT run this
     function with no_grad set True. Why? Because we need to evaluate derivatives
     of the solution with respect to the inputs! Thus, we need torch to build a
@@ -159,29 +175,31 @@ def Discovery_Testing(
     ----------------------------------------------------------------------------
     Returns:
 
-    a tuple of floats. The first element holds the collocation loss, while
-    the second holds the data loss. """
+    A two element tensor. The first element holds the collocation loss, while
+    the second holds the data loss. We return the losses as a (detached)
+    tensor, rather than as floats, so that the caller can decide when to copy
+    them back to the host. This avoids a device sync for each loss. """
 
     # Put the networks in evaluation mode
     Sol_NN.eval();
     PDE_NN.eval();
 
     # Get the losses at the passed collocation points (Note we enforce a 0 BC)
-    Coll_Loss : float = Collocation_Loss(
+    Coll_Loss : torch.Tensor = Collocation_Loss(
                             Sol_NN                      = Sol_NN,
                             PDE_NN                      = PDE_NN,
                             Time_Derivative_Order       = Time_Derivative_Order,
                             Spatial_Derivative_Order    = Spatial_Derivative_Order,
                             Collocation_Coords          = Collocation_Coords,
                             Data_Type                   = Data_Type,
-                            Device                      = Device).item();
+                            Device                      = Device);
 
-    Data_loss : float  = Data_Loss(
+    Data_loss : torch.Tensor = Data_Loss(
                             Sol_NN      = Sol_NN,
                             Data_Coords = Data_Coords,
                             Data_Values = Data_Values,
                             Data_Type   = Data_Type,
-                            Device      = Device).item();
+                            Device      = Device);
 
     # Return the losses.
-    return (Coll_Loss, Data_loss);
+    return torch.stack((Coll_Loss, Data_loss)).detach();
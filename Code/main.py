@@ -153,7 +153,8 @@ def main():
                 Data_Values                 = Data_Container.Train_Targets,
                 Optimizer                   = Optimizer,
                 Data_Type                   = torch.float32,
-                Device                      = Settings.Device);
+                Device                      = Settings.Device,
+                Mixed_Precision             = Settings.Mixed_Precision);
 
             # Periodically print loss updates. Otherwise, just print the Epoch #
             # to indicate that we're still alive.
@@ -169,7 +170,7 @@ def main():
                         Device           = Settings.Device);
 
                 # Evaluate losses on Testing, Training points.
-                (Test_Coll_Loss[i], Test_Data_Loss[i]) = Discovery_Testing(
+                Test_Losses  = Discovery_Testing(
                     Sol_NN                      = Sol_NN,
                     PDE_NN                      = PDE_NN,
                     Time_Derivative_Order       = Settings.PDE_Time_Derivative_Order,
@@ -180,7 +181,7 @@ def main():
                     Data_Type                   = torch.float32,
                     Device                      = Settings.Device);
 
-                (Train_Coll_Loss[i], Train_Data_Loss[i]) = Discovery_Testing(
+                Train_Losses = Discovery_Testing(
                     Sol_NN                      = Sol_NN,
                     PDE_NN                      = PDE_NN,
                     Time_Derivative_Order       = Settings.PDE_Time_Derivative_Order,
@@ -191,6 +192,13 @@ def main():
                     Data_Type                   = torch.float32,
                     Device                      = Settings.Device);
 
+                # Copy the losses back to the host (all at once, so that we only
+                # sync with the device once).
+                (Test_Coll_Loss[i],
+                 Test_Data_Loss[i],
+                 Train_Coll_Loss[i],
+                 Train_Data_Loss[i]) = torch.cat((Test_Losses, Train_Losses)).tolist();
+
                 # Print losses!
                 print("Epoch #%-4d | Test: \t Collocation = %.7f\t Data = %.7f\t Total = %.7f"
                     % (t, Test_Coll_Loss[i], Test_Data_Loss[i], Test_Coll_Loss[i] + Test_Data_Loss[i]));
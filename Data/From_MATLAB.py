@@ -25,6 +25,38 @@ def main():
 
 
 
+def Select_Coords(  t_points    : numpy.ndarray,
+                    x_points    : numpy.ndarray,
+                    Indicies    : numpy.ndarray) -> numpy.ndarray:
+    """ This function returns the (t, x) coordinates of a selection of points
+    from the grid defined by t_points and x_points. We index the grid the same
+    way as a flattened usol array. That is, each row of usol corresponds to a
+    particular position and each column to a particular time. Thus, the kth
+    entry of the flattened usol holds the value at (t_j, x_i), where
+    i = k // n_t and j = k % n_t (and n_t is the number of elements in
+    t_points). This lets us find the coordinates of the selected points
+    without building the full grid of coordinates.
+
+    ----------------------------------------------------------------------------
+    Arguments:
+
+    t_points, x_points: 1D arrays holding the t and x grid lines, respectively.
+
+    Indicies: A 1D integer array. Each element should be an index into the
+    flattened usol array.
+
+    ----------------------------------------------------------------------------
+    Returns:
+
+    A two-column array whose ith row holds the t, x coordinates of the point
+    corresponding to Indicies[i]. """
+
+    n_t : int = t_points.size;
+    return numpy.stack((t_points[Indicies %  n_t],
+                        x_points[Indicies // n_t]), axis = 1);
+
+
+
 def From_MATLAB(    Data_File_Name      : str,
                     Noise_Proportion    : float,
                     Num_Train_Examples  : int,
@@ -42,7 +74,7 @@ def From_MATLAB(    Data_File_Name      : str,
     yielding a noisy data set. Next, we draw a sample of Num_Train_Examples
     from the set of coordinates, along with the corresponding elements of noisy
     data set. This becomes our Training data set. We draw another sample of
-    Num_Test_Examples from the set of coordinates along with the
+    Num_Test_Examples from the remaining coordinates along with the
     corresponding elements of the noisy data set. These become our Testing set.
 
     Note: This function is currently hardcoded to work with data involving 1
@@ -69,10 +101,23 @@ def From_MATLAB(    Data_File_Name      : str,
     data_in = scipy.io.loadmat(Data_File_Path);
 
     # Fetch spatial, temporal coordinates and the true solution. We cast these
-    # to singles (32 bit fp) since that's what PDE-REAd uses.
-    t_points    = data_in['t'].reshape(-1).astype(dtype = numpy.float32);
-    x_points    = data_in['x'].reshape(-1).astype(dtype = numpy.float32);
-    Data_Set    = (numpy.real(data_in['usol'])).astype( dtype = numpy.float32);
+    # to singles (32 bit fp) since that's what PDE-REAd uses. We also make sure
+    # each one lives in its own C-contiguous buffer (loadmat may hand back
+    # Fortran-ordered or non-owning arrays), which keeps the reshapes and
+    # gathers below from silently copying.
+    t_points    = numpy.ascontiguousarray(data_in['t'].reshape(-1),       dtype = numpy.float32);
+    x_points    = numpy.ascontiguousarray(data_in['x'].reshape(-1),       dtype = numpy.float32);
+
+    # The solution may be stored as a complex array. If so, we only keep its
+    # real part. Either way, we cast it to a single precision contiguous array
+    # in one step (so that we only copy the solution at most once).
+    usol        = data_in['usol'];
+    Data_Set    = numpy.ascontiguousarray(usol.real if numpy.iscomplexobj(usol) else usol, dtype = numpy.float32);
+
+    # Check that the x values are uniformly spaced (as we assume they are).
+    # The tolerance is loose because x_points is single precision.
+    dx : float = x_points[1] - x_points[0];
+    assert(numpy.allclose(numpy.diff(x_points), dx, rtol = 1e-3));
 
     # Determine problem bounds.
     Input_Bounds : numpy.ndarray    = numpy.empty(shape = (2, 2), dtype = numpy.float32);
@@ -81,23 +126,32 @@ def From_MATLAB(    Data_File_Name      : str,
     Input_Bounds[1, 0]              = x_points[ 0];
     Input_Bounds[1, 1]              = x_points[-1];
 
-    # Add noise to true solution.
-    Noisy_Data_Set = Data_Set + (Noise_Proportion)*numpy.std(Data_Set)*numpy.random.randn(*Data_Set.shape);
+    # Add noise to true solution. We draw the noise directly into a single
+    # float32 buffer, scale it, and add it to the data set in place. This
+    # avoids the extra double precision temporaries that the expression
+    # Data_Set + c*randn(...) would create. Note that this overwrites the
+    # true solution: from here on, Data_Set holds the noisy data set.
+    Generator   = numpy.random.default_rng();
+    Noise       = numpy.empty_like(Data_Set);
+    Generator.standard_normal(out = Noise, dtype = numpy.float32);
+    numpy.multiply(Noise, (Noise_Proportion)*numpy.std(Data_Set), out = Noise);
 
-    # Generate the grid of (t, x) coordinates where we'll enforce the "true
-    # solution". Each row of these arrays corresponds to a particular position.
-    # Each column corresponds to a particular time.
-    t_coords_matrix, x_coords_matrix = numpy.meshgrid(t_points, x_points);
+    numpy.add(Data_Set, Noise, out = Data_Set);
 
     if(Make_Plot == True):
+        # Generate the grid of (t, x) coordinates for the plot. Each row of
+        # these arrays corresponds to a particular position. Each column
+        # corresponds to a particular time.
+        t_coords_matrix, x_coords_matrix = numpy.meshgrid(t_points, x_points);
+
         epsilon : float = .0001;
-        Data_min : float = numpy.min(Noisy_Data_Set) - epsilon;
-        Data_max : float = numpy.max(Noisy_Data_Set) + epsilon;
+        Data_min : float = numpy.min(Data_Set) - epsilon;
+        Data_max : float = numpy.max(Data_Set) + epsilon;
 
         # Plot!
         pyplot.contourf(    t_coords_matrix,
                             x_coords_matrix,
-                            Noisy_Data_Set,
+                            Data_Set,
                             levels      = numpy.linspace(Data_min, Data_max, 500),
                             cmap        = pyplot.cm.jet);
 
@@ -106,27 +160,29 @@ def From_MATLAB(    Data_File_Name      : str,
         pyplot.ylabel("x");
         pyplot.show();
 
-    # Now, stitch successive the rows of the coordinate matrices together
-    # to make a 1D array. We interpert the result as a 1 column matrix.
-    t_coords_1D : numpy.ndarray = t_coords_matrix.flatten().reshape(-1, 1);
-    x_coords_1D : numpy.ndarray = x_coords_matrix.flatten().reshape(-1, 1);
-
-    # Generate data coordinates, corresponding Data Values.
-    All_Data_Coords : numpy.ndarray = numpy.hstack((t_coords_1D, x_coords_1D));
-    All_Data_Values : numpy.ndarray = Noisy_Data_Set.flatten();
+    # Generate the Data Values. We use Select_Coords to recover the
+    # coordinates of the selected data points below, which means we never need
+    # to build the full grid of coordinates.
+    All_Data_Values : numpy.ndarray = Data_Set.reshape(-1);
 
     # Next, generate the Testing/Training sets. To do this, we sample a uniform
-    # distribution over subsets of {1, ... , N} of size Num_Train_Examples,
-    # and another over subsets of {1, ... , N} of size Num_Test_Examples.
-    # Here, N is the number of coordinates.
-    Train_Indicies : numpy.ndarray = numpy.random.choice(All_Data_Coords.shape[0], Num_Train_Examples, replace = False);
-    Test_Indicies  : numpy.ndarray = numpy.random.choice(All_Data_Coords.shape[0], Num_Test_Examples , replace = False);
+    # distribution over subsets of {1, ... , N} of size
+    # Num_Train_Examples + Num_Test_Examples (here, N is the number of
+    # coordinates). The sample is returned in random order, so we use its first
+    # Num_Train_Examples elements as the training set and the rest as the
+    # testing set. This ensures that the two sets are disjoint.
+    Indicies  : numpy.ndarray = Generator.choice(   All_Data_Values.shape[0],
+                                                    Num_Train_Examples + Num_Test_Examples,
+                                                    replace = False);
+
+    Train_Indicies : numpy.ndarray = Indicies[:Num_Train_Examples];
+    Test_Indicies  : numpy.ndarray = Indicies[Num_Train_Examples:];
 
     # Now select the corresponding testing, training data points/values.
-    Train_Inputs    = All_Data_Coords[Train_Indicies, :];
+    Train_Inputs    = Select_Coords(t_points, x_points, Train_Indicies);
     Train_Targets   = All_Data_Values[Train_Indicies];
 
-    Test_Inputs     = All_Data_Coords[Test_Indicies, :];
+    Test_Inputs     = Select_Coords(t_points, x_points, Test_Indicies);
     Test_Targets    = All_Data_Values[Test_Indicies];
 
     # Send everything to Create_Data_Set
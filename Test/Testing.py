@@ -9,6 +9,10 @@ parent_dir  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)));
 Code_path   = os.path.join(parent_dir, "Code");
 sys.path.append(Code_path);
 
+# Do the same for the Data directory.
+Data_path   = os.path.join(parent_dir, "Data");
+sys.path.append(Data_path);
+
 # Now we can do our usual import stuff.
 import numpy as np;
 import torch;
@@ -19,6 +23,8 @@ import Network;
 import Loss_Functions;
 import PDE_Residual;
 import Extraction;
+import Points;
+import From_MATLAB;
 
 
 
@@ -490,5 +496,72 @@ class Test_Extraction(unittest.TestCase):
 
 
 
+class Test_Points(unittest.TestCase):
+    def test_Generate_Points(self):
+        # Make up some random bounds. Let the lower bounds be negative so that
+        # we check the points are shifted (not just scaled) correctly.
+        Num_Dim : int = random.randint(1, 5);
+        Bounds        = torch.empty((Num_Dim, 2), dtype = torch.float32);
+        for j in range(Num_Dim):
+            Bounds[j, 0] = -random.uniform(1, 10);
+            Bounds[j, 1] =  random.uniform(1, 10);
+
+        # Generate the points.
+        Num_Points : int = random.randint(10, 1000);
+        Coords = Points.Generate_Points(
+                        Bounds      = Bounds,
+                        Num_Points  = Num_Points,
+                        Data_Type   = torch.float32,
+                        Device      = torch.device('cpu'));
+
+        # Check the shape, data type, and device.
+        self.assertEqual(Coords.shape, (Num_Points, Num_Dim));
+        self.assertEqual(Coords.dtype, torch.float32);
+        self.assertEqual(Coords.device.type, 'cpu');
+
+        # Check that every point lies within the bounds.
+        for j in range(Num_Dim):
+            self.assertTrue(torch.all(Coords[:, j] >= Bounds[j, 0]).item());
+            self.assertTrue(torch.all(Coords[:, j] <  Bounds[j, 1]).item());
+
+
+
+class Test_From_MATLAB(unittest.TestCase):
+    def test_Select_Coords(self):
+        # Make up a small, non-square grid, and a solution on it. As in a .mat
+        # file, each row of usol corresponds to a position and each column to
+        # a time.
+        n_t : int = random.randint(2, 20);
+        n_x : int = random.randint(n_t + 1, 30);
+
+        t_points = np.sort(np.random.rand(n_t)).astype(np.float32);
+        x_points = np.sort(np.random.rand(n_x)).astype(np.float32);
+        usol     = np.random.rand(n_x, n_t).astype(np.float32);
+
+        # Build the grid of coordinates using meshgrid (the way we used to),
+        # then select a random subset of them.
+        t_coords_matrix, x_coords_matrix = np.meshgrid(t_points, x_points);
+        All_Data_Coords = np.hstack((   t_coords_matrix.flatten().reshape(-1, 1),
+                                        x_coords_matrix.flatten().reshape(-1, 1)));
+
+        Indicies = np.random.choice(n_x*n_t, random.randint(1, n_x*n_t), replace = False);
+
+        Coords_Predict = All_Data_Coords[Indicies, :];
+        Coords_Actual  = From_MATLAB.Select_Coords(t_points, x_points, Indicies);
+
+        # The coordinates should match exactly.
+        self.assertEqual(Coords_Actual.shape, Coords_Predict.shape);
+        self.assertTrue(np.array_equal(Coords_Actual, Coords_Predict));
+
+        # Finally, check that each selected value of usol actually lives at
+        # the corresponding coordinate.
+        Values = usol.flatten()[Indicies];
+        for k in range(Indicies.size):
+            i : int = np.where(x_points == Coords_Actual[k, 1])[0][0];
+            j : int = np.where(t_points == Coords_Actual[k, 0])[0][0];
+            self.assertEqual(Values[k], usol[i, j]);
+
+
+
 if(__name__ == "__main__"):
     unittest.main();